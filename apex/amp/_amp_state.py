@@ -2,14 +2,32 @@
 # I'm a C++ guy, not a python guy.  I decided this approach because it seemed most C++-like.
 # But apparently it's ok:
 # http://effbot.org/pyfaq/how-do-i-share-global-variables-across-modules.htm
+import itertools
+import sys
+
 import torch
 
 
 class AmpState(object):
+    __slots__ = ("hard_override",
+                 "allow_incoming_model_not_fp32",
+                 "verbosity",
+                 "opt_properties",
+                 "loss_scalers",
+                 # min/max_loss_scale are set by amp.initialize, handle by amp.init.
+                 "min_loss_scale",
+                 "max_loss_scale",
+                 "handle")
+
     def __init__(self):
         self.hard_override=False
         self.allow_incoming_model_not_fp32 = False
         self.verbosity=1
+        self.opt_properties = None
+        self.loss_scalers = None
+        self.min_loss_scale = None
+        self.max_loss_scale = None
+        self.handle = None
 
 
 # Attribute stash.  Could also just stash things as global module attributes.
@@ -18,7 +36,8 @@ _amp_state = AmpState()
 
 def warn_or_err(msg):
     if _amp_state.hard_override:
-        print("Warning:  " + msg)
+        # stderr, so warnings don't interleave with training logs on stdout.
+        sys.stderr.write("Warning:  " + msg + "\n")
     else:
         raise RuntimeError(msg)
         # I'm not sure if allowing hard_override is a good idea.
@@ -54,6 +73,4 @@ def master_params(optimizer):
     Args:
         optimizer: An optimizer previously returned from ``amp.initialize``.
     """
-    for group in optimizer.param_groups:
-        for p in group['params']:
-            yield p
+    return itertools.chain.from_iterable(group['params'] for group in optimizer.param_groups)
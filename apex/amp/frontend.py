@@ -1,4 +1,7 @@
 from collections import OrderedDict
+import os
+from types import MappingProxyType
+import warnings
 
 import torch
 
@@ -6,191 +9,263 @@ from ._initialize import _initialize
 from ._amp_state import _amp_state, warn_or_err, maybe_print
 
 
+def _parse_verbose(value):
+    try:
+        return int(value)
+    except ValueError:
+        warnings.warn("Ignoring APEX_AMP_VERBOSE={!r}, which is not an integer; "
+                      "using APEX_AMP_VERBOSE=1.".format(value))
+        return 1
+
+
+# Set APEX_AMP_VERBOSE=0 to silence the option tables printed by amp.initialize, or
+# APEX_AMP_VERBOSE=2 to print the full table again after overrides instead of only
+# the options they changed.
+_VERBOSE = _parse_verbose(os.environ.get("APEX_AMP_VERBOSE", "1"))
+
+_FP16 = torch.float16
+_FP32 = torch.float32
+
+
+def _coerce_cast_model_type(properties, value):
+    if properties.opt_level == "O1" and value is not None:
+        if value is not False:
+            if value is not _FP32:
+                warn_or_err("O1 inserts casts around Torch functions rather than "
+                            "model weights, so with O1, the model weights themselves "
+                            "should remain FP32. If you wish to cast the model to a "
+                            "different type, use opt_level='O2' or 'O3'. " +
+                            "cast_model_type was {}".format(value))
+    return value
+
+
+def _coerce_patch_torch_functions(properties, value):
+    if properties.opt_level != "O1" and value:
+        warn_or_err("Currently, patch_torch_functions=True should only be set by "
+                    "selecting opt_level='O1'.")
+    return value
+
+
+# Accepted string spellings of keep_batchnorm_fp32.
+_BN32_STR = {"True" : True, "False" : False}
+
+
+def _coerce_keep_bn32(properties, value):
+    if properties.opt_level == "O1" and value is not None:
+        warn_or_err("With opt_level O1, batchnorm functions are automatically patched "
+                    "to run in FP32, so keep_batchnorm_fp32 should be None." +
+                    " keep_batchnorm_fp32 was {}".format(value))
+    coerced = _BN32_STR.get(value, value) if type(value) is str else value
+    assert (coerced is True or coerced is False or coerced is None),\
+        "keep_batchnorm_fp32 must be a boolean, the string 'True' or 'False', "\
+        "or None, found keep_batchnorm_fp32={}".format(value)
+    return coerced
+
+
+def _coerce_master_weights(properties, value):
+    if properties.opt_level == "O1" and value is not None:
+        warn_or_err("It doesn't make sense to use master_weights with O1. "
+                    "With O1, your model weights themselves should be FP32.")
+    return value
+
+
+def _coerce_loss_scale(properties, value):
+    # Floats are the documented common case and need no conversion.
+    if type(value) is float:
+        return value
+    if value == "dynamic":
+        return value
+    return float(value)
+
+
+# Option names, in the order they are reported by amp.initialize.
+_OPTION_NAMES = (
+    "enabled",
+    "opt_level",
+    "cast_model_type",
+    "patch_torch_functions",
+    "keep_batchnorm_fp32",
+    "master_weights",
+    "loss_scale",
+    # Reserved for future functionality
+    # "fused_optimizer",
+    # "enable_ddp_interop",
+    )
+
+_VALID_OPTS = frozenset(_OPTION_NAMES)
+
+
 class Properties(object):
     """
     This class has two purposes: to establish a set of default properties,
     and to route setting of these attributes through __setattr__ so that (in theory)
     they can be checked for consistency with other existing args.
     """
+    __slots__ = _OPTION_NAMES
+
+    # Per-option checks/coercions applied by __setattr__.  Options not listed here
+    # are stored as given.
+    _COERCERS = {
+        "cast_model_type" : _coerce_cast_model_type,
+        "patch_torch_functions" : _coerce_patch_torch_functions,
+        "keep_batchnorm_fp32" : _coerce_keep_bn32,
+        "master_weights" : _coerce_master_weights,
+        "loss_scale" : _coerce_loss_scale,
+        }
+
     def __init__(self):
-        self.options = {
-            "enabled" : False,
-            "opt_level" : None,
-            "cast_model_type" : None,
-            "patch_torch_functions" : False,
-            "keep_batchnorm_fp32" : None,
-            "master_weights" : None,
-            "loss_scale" : 1.0,
-            # Reserved for future functionality
-            # "fused_optimizer" : False,
-            # "enable_ddp_interop" : False,
-            }
+        # Defaults are stored directly, bypassing the checks in __setattr__.
+        object.__setattr__(self, "enabled", False)
+        object.__setattr__(self, "opt_level", None)
+        object.__setattr__(self, "cast_model_type", None)
+        object.__setattr__(self, "patch_torch_functions", False)
+        object.__setattr__(self, "keep_batchnorm_fp32", None)
+        object.__setattr__(self, "master_weights", None)
+        object.__setattr__(self, "loss_scale", 1.0)
+
+    @property
+    def options(self):
+        """
+        Snapshot of the current options as a dict.  Modifying the returned dict does
+        not modify self.
+        """
+        return {k: getattr(self, k) for k in _OPTION_NAMES}
 
     """
-    This function allows updating several options at a time without routing through
-    __setattr__ checks, to avoid "you can't get there from here" scenarios.
+    This function allows updating several options at a time from a dict.  All keys are
+    validated up front.  By default values are stored without routing through __setattr__
+    checks, to avoid "you can't get there from here" scenarios; pass check=True to apply
+    them in order through __setattr__ instead.
     Currently not intended to be exposed; users are expected to select an opt_level
     and apply consistent modifications.
     """
-    def _update_options_dict(self, new_options):
-        for k, v in new_options:
-            if k in self.options:
-                self.options[k] = v
-            else:
-                raise ValueError("Tried to set unexpected option {}".format(k))
+    def _update_options_dict(self, new_options, check=False):
+        unexpected = new_options.keys() - _VALID_OPTS
+        if unexpected:
+            raise ValueError("Tried to set unexpected option(s) {}".format(sorted(unexpected)))
+        setter = setattr if check else object.__setattr__
+        for k, v in new_options.items():
+            setter(self, k, v)
+
+    def __setattr__(self, name, value):
+        coerce = self._COERCERS.get(name)
+        if coerce is not None:
+            value = coerce(self, value)
+        object.__setattr__(self, name, value)
+
+
+class _DisabledProperties(Properties):
     """
-    The members of "options" are not direct attributes of self, so access attempts
-    will roll down to __getattr__.  This borrows from the logic in torch.nn.Module.
+    Read-only Properties holding the defaults, shared by every amp.initialize(enabled=False) call.
     """
-    def __getattr__(self, name):
-        if "options" in self.__dict__:
-            options =  self.__dict__["options"]
-            if name in options:
-                return options[name]
-        raise AttributeError("'{}' object has no attribute '{}'".format(
-            type(self).__name__, name))
+    __slots__ = ()
 
     def __setattr__(self, name, value):
-        if "options" in self.__dict__:
-            if name in self.options:
-                # print("setting {} {}".format(name, value))
-                if name == "cast_model_type":
-                    if self.opt_level == "O1" and value is not None:
-                        if value is not False:
-                            if value is not torch.float32:
-                                warn_or_err("O1 inserts casts around Torch functions rather than "
-                                            "model weights, so with O1, the model weights themselves "
-                                            "should remain FP32. If you wish to cast the model to a "
-                                            "different type, use opt_level='O2' or 'O3'. " +
-                                            "cast_model_type was {}".format(value))
-                    self.options[name] = value
-                elif name == "patch_torch_functions":
-                    if self.opt_level != "O1" and value:
-                        warn_or_err("Currently, patch_torch_functions=True should only be set by "
-                                    "selecting opt_level='O1'.")
-                    self.options[name] = value
-                elif name == "keep_batchnorm_fp32":
-                    if self.opt_level == "O1" and value is not None:
-                        warn_or_err("With opt_level O1, batchnorm functions are automatically patched "
-                                    "to run in FP32, so keep_batchnorm_fp32 should be None." +
-                                    " keep_batchnorm_fp32 was {}".format(value))
-                    if value == "False":
-                        self.options[name] = False
-                    elif value == "True":
-                        self.options[name] = True
-                    else:
-                        assert (value is True or value is False or value is None),\
-                            "keep_batchnorm_fp32 must be a boolean, the string 'True' or 'False', "\
-                            "or None, found keep_batchnorm_fp32={}".format(value)
-                        self.options[name] = value
-                elif name == "master_weights":
-                    if self.opt_level == "O1" and value is not None:
-                        warn_or_err("It doesn't make sense to use master_weights with O1. "
-                                    "With O1, your model weights themselves should be FP32.")
-                    self.options[name] = value
-                elif name == "loss_scale":
-                    if value == "dynamic":
-                        self.options[name] = value
-                    else:
-                        self.options[name] = float(value)
-                else:
-                    self.options[name] = value
-        else:
-            super(Properties, self).__setattr__(name, value)
-
-
-""" O0-O3 are convenience wrappers to establish defaults for typically used mixed precision options. """
-
-class O3:
-    brief = "O3:  Pure FP16 training."
-    more = "Calls .half() on your model, converting the entire model to FP16.\n"\
-        "A casting operation is also inserted to cast incoming Tensors to FP16,\n"\
-        "so you don't need to change your data pipeline.\n"\
-        "This mode is useful for establishing a performance ceiling.\n"\
-        "It's also possible training may 'just work' in this mode.\n"\
-        "If not, try other optimization levels."
-
-    def __call__(self, properties):
-        properties.enabled = True
-        properties.opt_level = "O3"
-        properties.cast_model_type = torch.float16
-        properties.patch_torch_functions = False
-        properties.keep_batchnorm_fp32 = False
-        properties.master_weights = False
-        properties.loss_scale = 1.0
-        # properties.fused_optimizer = False
-        # properties.enable_ddp_interop = False
-        return properties # modified in place so this isn't really necessary
-
-
-class O2:
-    brief = "O2:  FP16 training with FP32 batchnorm and FP32 master weights.\n"
-    more = "Calls .half() on your model, converting the entire model (except for batchnorms)\n"\
-        "to FP16.  Batchnorms are retained in FP32 for additional stability.\n"\
-        "The forward pass is patched to cast incoming Tensors to FP16, so you don't need to change\n"\
-        "your data pipeline.\n"\
-        "O2 creates FP32 master weights outside the model and patches any optimizers to update\n"\
-        "these master weights, then copy the master weights into the FP16 model weights.\n"\
-        "Master weights can also improve convergence and stability."
-
-    def __call__(self, properties):
-        properties.enabled = True
-        properties.opt_level = "O2"
-        properties.cast_model_type = torch.float16
-        properties.patch_torch_functions = False
-        properties.keep_batchnorm_fp32 = True
-        properties.master_weights = True
-        properties.loss_scale = "dynamic"
-        # properties.fused_optimizer = False
-        # properties.enable_ddp_interop = False
-        return properties # modified in place so this isn't really necessary
-
-
-class O1:
-    brief = "O1:  Insert automatic casts around Pytorch functions and Tensor methods.\n"
-    more = "The type of your model's weights is not altered.  However, internally,\n"\
-        "Pytorch functions are patched to cast any Tensor Core-friendly ops to FP16 for speed,\n"\
-        "while operations that might benefit from the additional stability of FP32 are patched\n"\
-        "to cast their inputs to fp32.\n"\
-        "O1 is the safest way to try mixed precision training, and is recommended when\n"\
-        "trying mixed precision training for the first time."
-
-    def __call__(self, properties):
-        properties.enabled = True
-        properties.opt_level = "O1"
-        properties.cast_model_type = None
-        properties.patch_torch_functions = True
-        properties.keep_batchnorm_fp32 = None
-        properties.master_weights = None
-        properties.loss_scale = "dynamic"
-        # properties.fused_optimizer = False
-        # properties.enable_ddp_interop = False
-        return properties # modified in place so this isn't really necessary
-
-
-class O0:
-    brief = "O0:  Pure FP32 training.\n"
-    more = "Your models are checked to make sure parameters are FP32, but otherwise the\n"\
-        "types of weights and internal Pytorch operations are not altered.  This mode disables any\n"\
-        "FP16 arithmetic, although other optimizations like DDP interop may still be requested.\n"
-
-    def __call__(self, properties):
-        properties.enabled = True
-        properties.opt_level = "O0"
-        properties.cast_model_type = torch.float32
-        properties.patch_torch_functions = False
-        properties.keep_batchnorm_fp32 = None
-        properties.master_weights = False
-        properties.loss_scale = 1.0
-        # properties.fused_optimizer = False
-        # properties.enable_ddp_interop = False
-        return properties # modified in place so this isn't really necessary
-
-
-opt_levels = {"O3": O3(),
-              "O2": O2(),
-              "O1": O1(),
-              "O0": O0()}
+        raise AttributeError("Properties for disabled Amp are read-only; "
+                             "tried to set '{}'".format(name))
+
+
+_DISABLED_PROPERTIES = _DisabledProperties()
+
+
+""" O0-O3 are convenience presets to establish defaults for typically used mixed precision options. """
+
+_PRESETS = {
+    "O3" : {
+        "enabled" : True,
+        "opt_level" : "O3",
+        "cast_model_type" : _FP16,
+        "patch_torch_functions" : False,
+        "keep_batchnorm_fp32" : False,
+        "master_weights" : False,
+        "loss_scale" : 1.0,
+        },
+    "O2" : {
+        "enabled" : True,
+        "opt_level" : "O2",
+        "cast_model_type" : _FP16,
+        "patch_torch_functions" : False,
+        "keep_batchnorm_fp32" : True,
+        "master_weights" : True,
+        "loss_scale" : "dynamic",
+        },
+    "O1" : {
+        "enabled" : True,
+        "opt_level" : "O1",
+        "cast_model_type" : None,
+        "patch_torch_functions" : True,
+        "keep_batchnorm_fp32" : None,
+        "master_weights" : None,
+        "loss_scale" : "dynamic",
+        },
+    "O0" : {
+        "enabled" : True,
+        "opt_level" : "O0",
+        "cast_model_type" : _FP32,
+        "patch_torch_functions" : False,
+        "keep_batchnorm_fp32" : None,
+        "master_weights" : False,
+        "loss_scale" : 1.0,
+        },
+    }
+
+_BRIEFS = {
+    "O3" : "O3:  Pure FP16 training.",
+    "O2" : "O2:  FP16 training with FP32 batchnorm and FP32 master weights.\n",
+    "O1" : "O1:  Insert automatic casts around Pytorch functions and Tensor methods.\n",
+    "O0" : "O0:  Pure FP32 training.\n",
+    }
+
+
+# Read-only view of the presets, keyed by opt_level.
+opt_levels = MappingProxyType({k: MappingProxyType(v) for k, v in _PRESETS.items()})
+
+
+def _apply_preset(preset):
+    """
+    Returns a new Properties populated with the defaults in ``preset``, an entry of opt_levels.
+    """
+    properties = Properties()
+    # Presets are self-consistent, so skip the per-option checks in __setattr__.
+    properties._update_options_dict(preset)
+    return properties
+
+
+# Row templates for the option tables, with each name already padded to width.
+_ROW_FMTS = {k: "{:22} : {{}}".format(k) for k in _OPTION_NAMES}
+
+
+def _emit(header, properties, footer=()):
+    """
+    Prints ``header``, the current value of each option in ``properties``, then ``footer``
+    as a single write, on rank 0 only.
+    """
+    if _VERBOSE <= 0:
+        return
+    lines = list(header)
+    lines.extend(_ROW_FMTS[k].format(getattr(properties, k)) for k in _OPTION_NAMES)
+    lines.extend(footer)
+    maybe_print("\n".join(lines), True)
+
+
+def _emit_overrides(before, properties):
+    """
+    Reports the options that differ from the ``before`` snapshot after user overrides.
+    ``before`` is only consulted at the default verbosity, and may be None otherwise.
+    """
+    if _VERBOSE <= 0:
+        return
+    if _VERBOSE >= 2:
+        _emit(("After processing overrides, optimization options are:",), properties)
+        return
+    lines = ["After processing overrides, changed optimization options are:"]
+    for k in _OPTION_NAMES:
+        value = getattr(properties, k)
+        if value != before[k]:
+            lines.append(_ROW_FMTS[k].format("{} -> {}".format(before[k], value)))
+    if len(lines) == 1:
+        lines = ["User overrides did not change any optimization options."]
+    maybe_print("\n".join(lines), True)
 
 
 # allow user to directly pass Properties struct as well?
@@ -309,7 +384,9 @@ def initialize(
     """
     from apex import deprecated_warning
     deprecated_warning("apex.amp is deprecated and will be removed by the end of February 2023. Use [PyTorch AMP](https://pytorch.org/docs/stable/amp.html)")
-    _amp_state.opt_properties = Properties()
+    # Reset up front, so a call that raises below doesn't leave an earlier call's
+    # properties in place.
+    _amp_state.opt_properties = _DISABLED_PROPERTIES
     _amp_state.verbosity = verbosity
 
     if not enabled:
@@ -322,44 +399,41 @@ def initialize(
         raise RuntimeError(
             "Amp requires torch.backends.cudnn.enabled = True")
 
-    if opt_level not in opt_levels:
+    preset = opt_levels.get(opt_level)
+    if preset is None:
         raise RuntimeError(
             "Unexpected optimization level {}. ".format(opt_level) +
             "Options are 'O0', 'O1', 'O2', 'O3'.  Note that in `O0`, `O1`, etc., the prefix O is the letter O, " +
             "not the number zero.")
     else:
-        _amp_state.opt_properties = opt_levels[opt_level](_amp_state.opt_properties)
-        maybe_print("Selected optimization level {}".format(opt_levels[opt_level].brief), True)
-        maybe_print("Defaults for this optimization level are:", True)
-        for k, v in _amp_state.opt_properties.options.items():
-            maybe_print("{:22} : {}".format(k, v), True)
+        properties = _apply_preset(preset)
+        _amp_state.opt_properties = properties
+        _emit(("Selected optimization level {}".format(_BRIEFS[opt_level]),
+               "Defaults for this optimization level are:"),
+              properties,
+              ("Processing user overrides (additional kwargs that are not None)...",))
 
     _amp_state.min_loss_scale = min_loss_scale
     _amp_state.max_loss_scale = max_loss_scale
 
-    maybe_print("Processing user overrides (additional kwargs that are not None)...", True)
     # I chose to have the keyword arguments listed directly in the argument list,
     # instead of **kwargs, so I can't use kwargs.items() here.
-    if enabled is not None:
-        _amp_state.opt_properties.enabled = enabled
-    if opt_level is not None:
-        _amp_state.opt_properties.opt_level = opt_level
-    if cast_model_type is not None:
-        _amp_state.opt_properties.cast_model_type = cast_model_type
-    if patch_torch_functions is not None:
-        _amp_state.opt_properties.patch_torch_functions = patch_torch_functions
-    if keep_batchnorm_fp32 is not None:
-        _amp_state.opt_properties.keep_batchnorm_fp32 = keep_batchnorm_fp32
-    if master_weights is not None:
-        _amp_state.opt_properties.master_weights = master_weights
-    if loss_scale is not None:
-        _amp_state.opt_properties.loss_scale = loss_scale
-
-    maybe_print("After processing overrides, optimization options are:", True)
-    for k, v in _amp_state.opt_properties.options.items():
-        maybe_print("{:22} : {}".format(k, v), True)
-
-    return _initialize(models, optimizers, _amp_state.opt_properties, num_losses, cast_model_outputs)
+    # Order matters:  enabled and opt_level are applied before the options whose
+    # checks depend on them.
+    # Only the default verbosity reports a diff against the pre-override options.
+    before = properties.options if _VERBOSE == 1 else None
+    overrides = (("enabled", enabled),
+                 ("opt_level", opt_level),
+                 ("cast_model_type", cast_model_type),
+                 ("patch_torch_functions", patch_torch_functions),
+                 ("keep_batchnorm_fp32", keep_batchnorm_fp32),
+                 ("master_weights", master_weights),
+                 ("loss_scale", loss_scale))
+    properties._update_options_dict({k: v for k, v in overrides if v is not None}, check=True)
+
+    _emit_overrides(before, properties)
+
+    return _initialize(models, optimizers, properties, num_losses, cast_model_outputs)
 
 
 def state_dict(destination=None):
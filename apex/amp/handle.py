@@ -78,7 +78,7 @@ def scale_loss(loss,
     .. _`Advanced Amp Usage`:
         https://nvidia.github.io/apex/advanced.html
     """
-    if not hasattr(_amp_state, "opt_properties"):
+    if _amp_state.opt_properties is None:
         raise RuntimeError("Invoked 'with amp.scale_loss`, but internal Amp state has not been initialized.  "
                            "model, optimizer = amp.initialize(model, optimizer, opt_level=...) must be called "
                            "before `with amp.scale_loss`.")
@@ -0,0 +1,114 @@
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+import torch
+
+from apex.amp import _amp_state, frontend
+from apex.amp.frontend import Properties, _apply_preset, initialize, opt_levels
+
+
+class TestFrontendOptions(unittest.TestCase):
+    def setUp(self):
+        self.hard_override = _amp_state.hard_override
+        _amp_state.hard_override = False
+
+    def tearDown(self):
+        _amp_state.hard_override = self.hard_override
+
+    def test_presets(self):
+        expected = {
+            "O0": (torch.float32, False, None, False, 1.0),
+            "O1": (None, True, None, None, "dynamic"),
+            "O2": (torch.float16, False, True, True, "dynamic"),
+            "O3": (torch.float16, False, False, False, 1.0),
+        }
+        for opt_level, values in expected.items():
+            properties = _apply_preset(opt_levels[opt_level])
+            self.assertTrue(properties.enabled)
+            self.assertEqual(properties.opt_level, opt_level)
+            self.assertEqual((properties.cast_model_type,
+                              properties.patch_torch_functions,
+                              properties.keep_batchnorm_fp32,
+                              properties.master_weights,
+                              properties.loss_scale), values)
+
+    def test_overrides_are_coerced(self):
+        properties = _apply_preset(opt_levels["O2"])
+        properties._update_options_dict({"keep_batchnorm_fp32": "False",
+                                         "loss_scale": "128.0"}, check=True)
+        self.assertIs(properties.keep_batchnorm_fp32, False)
+        self.assertEqual(properties.loss_scale, 128.0)
+
+        properties.loss_scale = 4
+        self.assertIs(type(properties.loss_scale), float)
+
+        with self.assertRaises(AssertionError):
+            properties.keep_batchnorm_fp32 = "yes"
+        with self.assertRaises(AssertionError):
+            properties.keep_batchnorm_fp32 = ["True"]
+
+    def test_inconsistent_override_raises(self):
+        properties = _apply_preset(opt_levels["O1"])
+        with self.assertRaises(RuntimeError):
+            properties.master_weights = True
+
+        _amp_state.hard_override = True
+        properties.master_weights = True
+        self.assertTrue(properties.master_weights)
+
+    def test_presets_are_read_only(self):
+        with self.assertRaises(TypeError):
+            opt_levels["O1"]["loss_scale"] = 1.0
+        with self.assertRaises(TypeError):
+            opt_levels["O4"] = {}
+
+    def test_disabled_properties_are_shared_and_read_only(self):
+        model = torch.nn.Linear(2, 2)
+        self.assertIs(initialize(model, enabled=False), model)
+        properties = _amp_state.opt_properties
+        self.assertFalse(properties.enabled)
+        initialize(model, enabled=False)
+        self.assertIs(_amp_state.opt_properties, properties)
+        with self.assertRaises(AttributeError):
+            properties.enabled = True
+
+    def test_failed_initialize_resets_properties(self):
+        model = torch.nn.Linear(2, 2)
+        _amp_state.opt_properties = _apply_preset(opt_levels["O2"])
+        with self.assertRaises(RuntimeError):
+            initialize(model, opt_level="O4")
+        self.assertFalse(_amp_state.opt_properties.enabled)
+
+    def _initialize_output(self, verbose, **kwargs):
+        model = torch.nn.Linear(2, 2).cuda()
+        stdout = io.StringIO()
+        with mock.patch.object(frontend, "_VERBOSE", verbose), contextlib.redirect_stdout(stdout):
+            initialize(model, opt_level="O0", **kwargs)
+        return stdout.getvalue()
+
+    def test_override_output(self):
+        output = self._initialize_output(1, loss_scale=128.0)
+        changed = output.split("After processing overrides, changed optimization options are:\n")[1]
+        self.assertEqual(changed, "loss_scale             : 1.0 -> 128.0\n")
+
+        output = self._initialize_output(1)
+        self.assertTrue(output.endswith(
+            "User overrides did not change any optimization options.\n"))
+
+        output = self._initialize_output(2, loss_scale=128.0)
+        full = output.split("After processing overrides, optimization options are:\n")[1]
+        self.assertEqual(len(full.splitlines()), 7)
+        self.assertIn("loss_scale             : 128.0\n", full)
+
+        self.assertEqual(self._initialize_output(0, loss_scale=128.0), "")
+
+    def test_unexpected_option_raises(self):
+        properties = Properties()
+        with self.assertRaises(ValueError):
+            properties._update_options_dict({"fused_optimizer": True})
+
+
+if __name__ == "__main__":
+    unittest.main()